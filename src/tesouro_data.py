@@ -17,20 +17,153 @@ Exemplo de uso:
     print(df.head())
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
 import re
 import tempfile
+import time
 import warnings
 from datetime import datetime, date
 from pathlib import Path
 from typing import List, Optional, Union
 from urllib.parse import urljoin
 
+import httpx
 import pandas as pd
 import requests
+from concurrent.futures import ProcessPoolExecutor
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+logger = logging.getLogger(__name__)
+
+
+def _clean_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Limpa e processa dados do DataFrame, capturando bid e ask.
+
+    Função de módulo (picklável) para permitir uso em pool de processos.
+
+    Args:
+        df: DataFrame bruto lido do Excel
+
+    Returns:
+        DataFrame limpo
+    """
+    if df.empty:
+        return df
+    # Selecionar as 5 primeiras colunas para capturar bid e ask.
+    # Cópia rasa apenas: o DataFrame de origem é descartado pelo chamador,
+    # então não há motivo para duplicar os dados
+    df = df.iloc[:, :5].copy(deep=False)
+    # Renomear todas as colunas seguindo a convenção correta:
+    # yield_ask = Taxa Compra Manhã, yield_bid = Taxa Venda Manhã
+    # price_ask = PU Compra Manhã, price_bid = PU Venda Manhã
+    df.columns = ['ref_date', 'yield_ask', 'yield_bid', 'price_ask', 'price_bid']
+    # Converter as colunas numéricas em lote, usando float32
+    # (precisão simples é suficiente para taxas e PUs e usa metade da memória)
+    num_cols = ['yield_bid', 'yield_ask', 'price_bid', 'price_ask']
+    df[num_cols] = df[num_cols].apply(pd.to_numeric, errors='coerce').astype('float32')
+    # Processar datas com formato específico para evitar warnings
+    df['ref_date'] = pd.to_datetime(df['ref_date'], format='%d/%m/%Y', errors='coerce')
+    # Filtrar em uma única passada: linhas com dados faltantes em qualquer
+    # coluna e linhas com preço de compra zerado
+    mask = (
+        df['ref_date'].notna()
+        & df[num_cols].notna().all(axis=1)
+        & (df['price_bid'] != 0)
+    )
+    df = df.loc[mask]
+    return df
+
+
+def _write_parquet_atomic(df: pd.DataFrame, parquet_path: Path, compression: str) -> None:
+    """
+    Grava um DataFrame em Parquet de forma atômica (temporário + rename),
+    para nunca deixar um arquivo truncado no lugar do cache final.
+
+    Args:
+        df: DataFrame a gravar
+        parquet_path: Caminho final do arquivo Parquet
+        compression: Codec de compressão passado ao to_parquet
+    """
+    tmp_path = parquet_path.with_suffix(parquet_path.suffix + '.part')
+    try:
+        df.to_parquet(tmp_path, compression=compression)
+        os.replace(tmp_path, parquet_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_excel_file(file_path: Path) -> pd.DataFrame:
+    """
+    Lê arquivo Excel e processa todas as abas.
+
+    Função de módulo (picklável) para permitir uso em pool de processos.
+
+    Args:
+        file_path: Caminho para o arquivo Excel
+
+    Returns:
+        DataFrame consolidado com dados de todas as abas
+    """
+    # Cache Parquet por arquivo: o conteúdo de um xls já baixado é imutável,
+    # então basta processá-lo uma única vez. Se o xls for rebaixado, seu
+    # mtime passa a ser mais novo que o do Parquet e o cache é ignorado
+    parquet_path = file_path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= file_path.stat().st_mtime:
+        try:
+            logger.info(f"  Lendo cache Parquet: {parquet_path.name}")
+            return pd.read_parquet(parquet_path)
+        except Exception as e:
+            # Cache corrompido: descartar e reprocessar o xls normalmente
+            logger.warning(f"  ⚠ Cache Parquet inválido ({parquet_path.name}), "
+                           f"reprocessando xls: {e}")
+            parquet_path.unlink(missing_ok=True)
+
+    logger.info(f"  Lendo arquivo: {file_path.name}")
+
+    try:
+        # Ler todas as abas em uma única abertura do arquivo
+        # (calamine: parser Rust, bem mais rápido que xlrd)
+        sheets = pd.read_excel(file_path, sheet_name=None, skiprows=1, engine="calamine")
+        all_data = []
+
+        for sheet_name, df in sheets.items():
+            logger.info(f"    Processando aba: {sheet_name}")
+
+            if not df.empty:
+                # Limpar dados
+                df = _clean_data(df)
+
+                if not df.empty:
+                    # Adicionar código do ativo
+                    df['asset_code'] = sheet_name
+                    all_data.append(df)
+
+        if all_data:
+            result = pd.concat(all_data, ignore_index=True)
+            logger.info(f"  ✓ Processadas {len(all_data)} abas com {len(result)} registros")
+
+            # Salvar Parquet para as próximas execuções pularem o xls
+            try:
+                _write_parquet_atomic(result, parquet_path, compression='zstd')
+            except Exception as e:
+                logger.warning(f"  ⚠ Falha ao salvar cache Parquet {parquet_path.name}: {e}")
+
+            return result
+        else:
+            logger.warning(f"  ⚠ Nenhum dado encontrado no arquivo")
+            return pd.DataFrame()
+
+    except Exception as e:
+        logger.warning(f"  ✗ Erro ao ler arquivo {file_path}: {e}")
+        return pd.DataFrame()
+
 
 class TesouroDireto:
     """
@@ -52,32 +185,82 @@ class TesouroDireto:
     
     # Primeiro ano com dados disponíveis
     FIRST_YEAR = 2005
-    
-    def __init__(self, cache_dir: Optional[str] = None):
+
+    # Número máximo de downloads simultâneos
+    DOWNLOAD_CONCURRENCY = 16
+
+    # Política de retry compartilhada pelos caminhos síncrono e assíncrono
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 1
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    # Tempo padrão (em segundos) para considerar fresco o arquivo do ano atual
+    DEFAULT_CACHE_TTL = 6 * 3600
+
+    # Tamanho do buffer (bytes) usado ao gravar downloads em disco
+    CHUNK_SIZE = 65536
+
+    # Corpo menor que isso não é um xls válido (arquivo vazio ou placeholder)
+    MIN_FILE_SIZE = 512
+
+    # Regex pré-compilada para extrair a data de vencimento (ddmmyy) do código
+    _MATURITY_RE = re.compile(r'(\d{6})$')
+
+    # Prefixos normalizados -> formato de exibição (ordem importa:
+    # NTN_B_Principal precisa vir antes de NTN_B)
+    _DENORM = {
+        "NTN_B_Principal": "NTN-B Principal",
+        "NTN_F": "NTN-F",
+        "NTN_B": "NTN-B",
+        "NTN_C": "NTN-C",
+    }
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 cache_ttl: float = DEFAULT_CACHE_TTL):
         """
         Inicializa a classe TesouroDireto.
-        
+
         Args:
-            cache_dir: Diretório para cache dos arquivos baixados. 
+            cache_dir: Diretório para cache dos arquivos baixados.
                       Se None, usa diretório temporário.
+            cache_ttl: Tempo (segundos) durante o qual o arquivo do ano atual
+                      é considerado fresco e não é rebaixado. Use 0 para
+                      sempre revalidar. Para forçar atualização, basta
+                      apagar o arquivo em cache.
         """
+        self.cache_ttl = cache_ttl
         if cache_dir is None:
             self.cache_dir = Path(tempfile.gettempdir()) / "td-files"
         else:
             self.cache_dir = Path(cache_dir)
-        
+
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        # URLs que retornaram 404 em execuções anteriores (persistidas em
+        # disco para não re-sondar combinações ativo/ano inexistentes)
+        self._missing_urls_path = self.cache_dir / "missing.json"
+        self._missing_urls = self._load_missing_urls()
+
         # Configurar sessão HTTP com retry
         self.session = requests.Session()
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF,
+            status_forcelist=list(self.RETRY_STATUSES),
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,
+            pool_maxsize=32,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        # Reaproveitar conexões TCP/TLS entre downloads
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate",
+        })
     
     def get_available_assets(self) -> List[str]:
         """Retorna lista de ativos disponíveis."""
@@ -105,13 +288,12 @@ class TesouroDireto:
         Returns:
             Código desnormalizado (ex: 'NTN-B Principal')
         """
-        # Corrige nomes específicos baseado no código R
-        asset_code = asset_code.replace("NTN_B_Principal", "NTN-B Principal")
-        asset_code = asset_code.replace("NTN_F", "NTN-F")
-        asset_code = asset_code.replace("NTN_B", "NTN-B") 
-        asset_code = asset_code.replace("NTN_C", "NTN-C")
-        asset_code = asset_code.replace("_", " ")
-        return asset_code
+        # Corrige nomes específicos baseado no código R, via tabela de
+        # prefixos: uma única busca em vez de cinco str.replace encadeados
+        for prefix, display in self._DENORM.items():
+            if asset_code.startswith(prefix):
+                return display + asset_code[len(prefix):].replace("_", " ")
+        return asset_code.replace("_", " ")
     
     def _get_maturity_date(self, asset_code: str) -> Optional[date]:
         """
@@ -124,7 +306,7 @@ class TesouroDireto:
             Data de vencimento ou None se não encontrada
         """
         # Extrair últimos 6 caracteres (formato ddmmyy)
-        match = re.search(r'(\d{6})$', asset_code.replace(' ', ''))
+        match = self._MATURITY_RE.search(asset_code.replace(' ', ''))
         if not match:
             return None
         
@@ -145,6 +327,137 @@ class TesouroDireto:
         except ValueError:
             return None
     
+    def _load_missing_urls(self) -> set:
+        """
+        Carrega o conjunto de URLs sabidamente inexistentes.
+
+        Returns:
+            Conjunto de URLs que retornaram 404 em execuções anteriores
+        """
+        if not self._missing_urls_path.exists():
+            return set()
+        try:
+            with open(self._missing_urls_path, 'r', encoding='utf-8') as f:
+                return set(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            return set()
+
+    def _mark_url_missing(self, url: str) -> None:
+        """
+        Registra uma URL como inexistente e persiste o conjunto em disco.
+
+        Args:
+            url: URL que retornou 404
+        """
+        self._missing_urls.add(url)
+        with open(self._missing_urls_path, 'w', encoding='utf-8') as f:
+            json.dump(sorted(self._missing_urls), f)
+
+    def _result_cache_path(self,
+                           asset_codes: List[str],
+                           first_year: int,
+                           last_year: int,
+                           all_files: List[Path]) -> Path:
+        """
+        Caminho do cache Parquet do resultado final.
+
+        A chave é um hash dos parâmetros da consulta e dos mtimes dos
+        arquivos de origem, então qualquer arquivo rebaixado invalida
+        o cache automaticamente.
+
+        Args:
+            asset_codes: Lista de códigos de ativos
+            first_year: Primeiro ano dos dados
+            last_year: Último ano dos dados
+            all_files: Arquivos Excel que alimentam o resultado
+
+        Returns:
+            Caminho do arquivo Parquet correspondente à consulta
+        """
+        payload = {
+            'assets': sorted(asset_codes),
+            'first_year': first_year,
+            'last_year': last_year,
+            'mtimes': [f.stat().st_mtime for f in sorted(all_files)],
+        }
+        key = hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        return self.cache_dir / f"result-{key}.parquet"
+
+    def _cache_is_fresh(self, local_file: Path) -> bool:
+        """
+        Verifica se um arquivo em cache ainda está dentro do TTL.
+
+        Args:
+            local_file: Caminho do arquivo em cache
+
+        Returns:
+            True se o arquivo existe e foi baixado há menos de cache_ttl
+        """
+        if self.cache_ttl <= 0 or not local_file.exists():
+            return False
+        age = time.time() - local_file.stat().st_mtime
+        return age < self.cache_ttl
+
+    def _meta_path(self, local_file: Path) -> Path:
+        """Caminho do arquivo de metadados HTTP associado a um download."""
+        return local_file.with_suffix(local_file.suffix + '.meta.json')
+
+    def _load_meta(self, local_file: Path) -> dict:
+        """
+        Carrega metadados HTTP (ETag/Last-Modified) de um download anterior.
+
+        Args:
+            local_file: Caminho do arquivo baixado
+
+        Returns:
+            Dicionário de metadados (vazio se não existir ou for inválido)
+        """
+        meta_path = self._meta_path(local_file)
+        if not meta_path.exists():
+            return {}
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_meta(self, local_file: Path, etag: Optional[str],
+                   last_modified: Optional[str]) -> None:
+        """
+        Salva metadados HTTP de um download para validação condicional futura.
+
+        Args:
+            local_file: Caminho do arquivo baixado
+            etag: Valor do header ETag da resposta
+            last_modified: Valor do header Last-Modified da resposta
+        """
+        meta = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'mtime': local_file.stat().st_mtime,
+        }
+        with open(self._meta_path(local_file), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def _conditional_headers(self, local_file: Path) -> dict:
+        """
+        Monta headers If-None-Match/If-Modified-Since a partir dos metadados.
+
+        Args:
+            local_file: Caminho do arquivo em cache
+
+        Returns:
+            Dicionário de headers condicionais (vazio se não há cache válido)
+        """
+        headers = {}
+        if local_file.exists():
+            meta = self._load_meta(local_file)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
     def _download_file(self, asset_code: str, year: int) -> Optional[Path]:
         """
         Baixa arquivo Excel para um ativo e ano específicos.
@@ -166,100 +479,307 @@ class TesouroDireto:
         # Se arquivo já existe e não é do ano atual, pular download
         current_year = datetime.now().year
         if local_file.exists() and year != current_year:
-            print(f"  Arquivo encontrado em cache: {filename}")
+            logger.info(f"  Arquivo encontrado em cache: {filename}")
             return local_file
-        
+
+        # Arquivo do ano atual: pular download se ainda dentro do TTL
+        if self._cache_is_fresh(local_file):
+            age_hours = (time.time() - local_file.stat().st_mtime) / 3600
+            logger.info(f"  Usando cache recente ({age_hours:.1f}h): {filename}")
+            return local_file
+
         # Construir URL
         url = f"{self.BASE_URL}/{year}/{filename}"
-        
+
+        # Gravar em arquivo temporário e renomear ao final, para nunca deixar
+        # um .xls corrompido no cache se o download for interrompido
+        tmp_file = local_file.with_suffix(local_file.suffix + '.part')
+
+        # Combinações ativo/ano que já retornaram 404 não são re-sondadas
+        if url in self._missing_urls:
+            logger.info(f"  Pulando {filename}: arquivo sabidamente inexistente")
+            return None
+
         try:
-            print(f"  Baixando: {filename}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            with open(local_file, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"  ✓ {filename} baixado com sucesso")
+            # Sondar com HEAD antes de baixar: muitas combinações não existem.
+            # Quando já há cópia local, o GET condicional cuida da
+            # revalidação, então a sonda seria um round trip redundante
+            if not local_file.exists():
+                head = self.session.head(url, timeout=10)
+                if head.status_code == 404:
+                    # Arquivo do ano atual pode ser publicado mais tarde;
+                    # só memorizar 404 de anos passados
+                    if year != current_year:
+                        self._mark_url_missing(url)
+                    logger.warning(f"  ✗ Arquivo inexistente no servidor: {filename}")
+                    return None
+
+                # Corpo minúsculo: não é um xls de verdade, pular o download
+                content_length = head.headers.get('Content-Length')
+                if content_length and content_length.isdigit() \
+                        and int(content_length) < self.MIN_FILE_SIZE:
+                    logger.warning(f"  ⚠ Arquivo vazio no servidor "
+                                   f"({content_length} bytes): {filename}")
+                    return None
+
+            logger.info(f"  Baixando: {filename}")
+            with self.session.get(url, timeout=30, stream=True,
+                                  headers=self._conditional_headers(local_file)) as response:
+                # 304: arquivo em cache continua válido, evita baixar o corpo
+                if response.status_code == 304:
+                    logger.info(f"  Arquivo não modificado no servidor: {filename}")
+                    return local_file
+
+                response.raise_for_status()
+
+                with open(tmp_file, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                        f.write(chunk)
+
+                os.replace(tmp_file, local_file)
+                self._save_meta(local_file,
+                                response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'))
+
+            logger.info(f"  ✓ {filename} baixado com sucesso")
             return local_file
-            
+
         except requests.exceptions.RequestException as e:
-            print(f"  ✗ Erro ao baixar {filename}: {e}")
+            tmp_file.unlink(missing_ok=True)
+            logger.warning(f"  ✗ Erro ao baixar {filename}: {e}")
             return None
-    
+
+    async def _download_file_async(self,
+                                   client: "httpx.AsyncClient",
+                                   asset_code: str,
+                                   year: int,
+                                   sem: asyncio.Semaphore) -> Optional[Path]:
+        """
+        Versão assíncrona de _download_file, para downloads simultâneos.
+
+        Args:
+            client: Cliente httpx compartilhado (HTTP/2)
+            asset_code: Código do ativo
+            year: Ano dos dados
+            sem: Semáforo que limita o número de downloads simultâneos
+
+        Returns:
+            Caminho para o arquivo baixado ou None se falhou
+        """
+        normalized_code = self._normalize_asset_code(asset_code)
+        asset_folder = self.cache_dir / normalized_code
+        asset_folder.mkdir(parents=True, exist_ok=True)
+
+        filename = f"{normalized_code}_{year}.xls"
+        local_file = asset_folder / filename
+
+        # Se arquivo já existe e não é do ano atual, pular download
+        current_year = datetime.now().year
+        if local_file.exists() and year != current_year:
+            logger.info(f"  Arquivo encontrado em cache: {filename}")
+            return local_file
+
+        # Arquivo do ano atual: pular download se ainda dentro do TTL
+        if self._cache_is_fresh(local_file):
+            age_hours = (time.time() - local_file.stat().st_mtime) / 3600
+            logger.info(f"  Usando cache recente ({age_hours:.1f}h): {filename}")
+            return local_file
+
+        # Construir URL
+        url = f"{self.BASE_URL}/{year}/{filename}"
+
+        # Gravar em arquivo temporário e renomear ao final, para nunca deixar
+        # um .xls corrompido no cache se o download for interrompido
+        tmp_file = local_file.with_suffix(local_file.suffix + '.part')
+
+        # Combinações ativo/ano que já retornaram 404 não são re-sondadas
+        if url in self._missing_urls:
+            logger.info(f"  Pulando {filename}: arquivo sabidamente inexistente")
+            return None
+
+        async with sem:
+            # Mesma política da sessão síncrona: re-tentar respostas 429/5xx
+            # com backoff exponencial (erros de conexão são re-tentados pelo
+            # próprio transporte httpx)
+            for attempt in range(self.MAX_RETRIES + 1):
+                if attempt:
+                    await asyncio.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
+
+                try:
+                    # Sondar com HEAD antes de baixar: muitas combinações não
+                    # existem. Quando já há cópia local, o GET condicional
+                    # cuida da revalidação, então a sonda seria um round trip
+                    # redundante
+                    if not local_file.exists():
+                        head = await client.head(url)
+                        if head.status_code == 404:
+                            # Arquivo do ano atual pode ser publicado mais tarde;
+                            # só memorizar 404 de anos passados
+                            if year != current_year:
+                                self._mark_url_missing(url)
+                            logger.warning(f"  ✗ Arquivo inexistente no servidor: {filename}")
+                            return None
+                        if head.status_code in self.RETRY_STATUSES:
+                            logger.warning(f"  Tentativa {attempt + 1} falhou "
+                                           f"({head.status_code}): {filename}")
+                            continue
+
+                        # Corpo minúsculo: não é um xls de verdade, pular o download
+                        content_length = head.headers.get('Content-Length')
+                        if content_length and content_length.isdigit() \
+                                and int(content_length) < self.MIN_FILE_SIZE:
+                            logger.warning(f"  ⚠ Arquivo vazio no servidor "
+                                           f"({content_length} bytes): {filename}")
+                            return None
+
+                    logger.info(f"  Baixando: {filename}")
+                    async with client.stream('GET', url,
+                                             headers=self._conditional_headers(local_file)) as response:
+                        # 304: arquivo em cache continua válido, evita baixar o corpo
+                        if response.status_code == 304:
+                            logger.info(f"  Arquivo não modificado no servidor: {filename}")
+                            return local_file
+
+                        if response.status_code in self.RETRY_STATUSES:
+                            logger.warning(f"  Tentativa {attempt + 1} falhou "
+                                           f"({response.status_code}): {filename}")
+                            continue
+
+                        response.raise_for_status()
+
+                        with open(tmp_file, 'wb') as f:
+                            async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                                f.write(chunk)
+
+                        os.replace(tmp_file, local_file)
+                        self._save_meta(local_file,
+                                        response.headers.get('ETag'),
+                                        response.headers.get('Last-Modified'))
+
+                    logger.info(f"  ✓ {filename} baixado com sucesso")
+                    return local_file
+
+                except httpx.HTTPError as e:
+                    tmp_file.unlink(missing_ok=True)
+                    logger.warning(f"  ✗ Erro ao baixar {filename}: {e}")
+                    return None
+
+            logger.warning(f"  ✗ Desistindo de {filename} após "
+                           f"{self.MAX_RETRIES + 1} tentativas")
+            return None
+
+    def _revalidation_needed(self, asset_codes: List[str], years: List[int]) -> bool:
+        """
+        Indica se algum arquivo do ano atual precisa ser revalidado na rede.
+
+        Arquivos de anos passados são imutáveis e nunca são rebaixados, mas
+        o arquivo do ano atual muda no servidor; se ele não estiver dentro
+        do TTL, o pipeline precisa rodar para o GET condicional conferir.
+
+        Args:
+            asset_codes: Lista de códigos de ativos
+            years: Lista de anos
+
+        Returns:
+            True se o pipeline precisa rodar para revalidar o ano atual
+        """
+        current_year = datetime.now().year
+        if current_year not in years:
+            return False
+        for asset_code in asset_codes:
+            normalized_code = self._normalize_asset_code(asset_code)
+            local_file = (self.cache_dir / normalized_code
+                          / f"{normalized_code}_{current_year}.xls")
+            if not self._cache_is_fresh(local_file):
+                return True
+        return False
+
+    def _existing_files(self, asset_codes: List[str], years: List[int]) -> List[Path]:
+        """
+        Lista os arquivos já presentes no cache para os pares (ativo, ano).
+
+        Args:
+            asset_codes: Lista de códigos de ativos
+            years: Lista de anos
+
+        Returns:
+            Caminhos dos arquivos Excel existentes no cache
+        """
+        files = []
+        for asset_code in asset_codes:
+            normalized_code = self._normalize_asset_code(asset_code)
+            for year in years:
+                local_file = self.cache_dir / normalized_code / f"{normalized_code}_{year}.xls"
+                if local_file.exists():
+                    files.append(local_file)
+        return files
+
+    async def _download_and_parse_async(self,
+                                        asset_codes: List[str],
+                                        years: List[int],
+                                        executor: ProcessPoolExecutor) -> List[Optional[pd.DataFrame]]:
+        """
+        Pipeline produtor/consumidor: baixa todos os pares (ativo, ano) de
+        forma concorrente e envia cada arquivo ao pool de processos assim
+        que o download termina, sobrepondo rede e CPU.
+
+        Args:
+            asset_codes: Lista de códigos de ativos
+            years: Lista de anos
+            executor: Pool de processos para o parsing dos arquivos Excel
+
+        Returns:
+            Lista de DataFrames processados (None para downloads que falharam)
+        """
+        sem = asyncio.Semaphore(self.DOWNLOAD_CONCURRENCY)
+        # HTTP/2 multiplexa vários downloads em poucas conexões TCP/TLS;
+        # o transporte re-tenta erros de conexão (429/5xx são tratados em
+        # _download_file_async)
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            retries=self.MAX_RETRIES,
+        )
+        loop = asyncio.get_running_loop()
+
+        async with httpx.AsyncClient(transport=transport, timeout=30.0) as client:
+            async def download_then_parse(asset_code: str, year: int) -> Optional[pd.DataFrame]:
+                file_path = await self._download_file_async(client, asset_code, year, sem)
+                if file_path is None:
+                    return None
+                return await loop.run_in_executor(executor, _read_excel_file, file_path)
+
+            tasks = [
+                download_then_parse(asset_code, year)
+                for asset_code in asset_codes
+                for year in years
+            ]
+            return await asyncio.gather(*tasks)
+
     def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Limpa e processa dados do DataFrame, capturando bid e ask.
-        
+
         Args:
             df: DataFrame bruto lido do Excel
-            
+
         Returns:
             DataFrame limpo
         """
-        if df.empty:
-            return df
-        # Selecionar as 5 primeiras colunas para capturar bid e ask
-        df = df.iloc[:, [0, 1, 2, 3, 4]].copy()
-        # Renomear todas as colunas seguindo a convenção correta:
-        # yield_ask = Taxa Compra Manhã, yield_bid = Taxa Venda Manhã
-        # price_ask = PU Compra Manhã, price_bid = PU Venda Manhã
-        df.columns = ['ref_date', 'yield_ask', 'yield_bid', 'price_ask', 'price_bid']
-        # Converter todas as colunas numéricas
-        for col in ['yield_bid', 'yield_ask', 'price_bid', 'price_ask']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        # Processar datas com formato específico para evitar warnings
-        df['ref_date'] = pd.to_datetime(df['ref_date'], format='%d/%m/%Y', errors='coerce')
-        # Remover linhas com dados faltantes em qualquer uma das colunas
-        df = df.dropna()
-        # Remover linhas com preços de compra zerados
-        df = df[df['price_bid'] != 0]
-        return df
-    
+        return _clean_data(df)
+
     def _read_excel_file(self, file_path: Path) -> pd.DataFrame:
         """
         Lê arquivo Excel e processa todas as abas.
-        
+
         Args:
             file_path: Caminho para o arquivo Excel
-            
+
         Returns:
             DataFrame consolidado com dados de todas as abas
         """
-        print(f"  Lendo arquivo: {file_path.name}")
-        
-        try:
-            # Ler todas as abas do arquivo
-            excel_file = pd.ExcelFile(file_path)
-            all_data = []
-            
-            for sheet_name in excel_file.sheet_names:
-                print(f"    Processando aba: {sheet_name}")
-                
-                # Ler aba (pular primeira linha como no código R)
-                df = pd.read_excel(file_path, sheet_name=sheet_name, skiprows=1)
-                
-                if not df.empty:
-                    # Limpar dados
-                    df = self._clean_data(df)
-                    
-                    if not df.empty:
-                        # Adicionar código do ativo
-                        df['asset_code'] = sheet_name
-                        all_data.append(df)
-            
-            if all_data:
-                result = pd.concat(all_data, ignore_index=True)
-                print(f"  ✓ Processadas {len(all_data)} abas com {len(result)} registros")
-                return result
-            else:
-                print(f"  ⚠ Nenhum dado encontrado no arquivo")
-                return pd.DataFrame()
-                
-        except Exception as e:
-            print(f"  ✗ Erro ao ler arquivo {file_path}: {e}")
-            return pd.DataFrame()
-    
+        return _read_excel_file(file_path)
+
     def get_treasury_data(self, 
                          asset_codes: Optional[List[str]] = None,
                          first_year: int = 2020,
@@ -297,57 +817,93 @@ class TesouroDireto:
             raise ValueError(f"Códigos de ativos inválidos: {invalid_codes}. "
                            f"Códigos válidos: {self.AVAILABLE_ASSETS}")
         
-        print(f"Baixando dados do Tesouro Direto")
-        print(f"Ativos: {asset_codes}")
-        print(f"Período: {first_year}-{last_year}")
-        print()
+        logger.info(f"Baixando dados do Tesouro Direto")
+        logger.info(f"Ativos: {asset_codes}")
+        logger.info(f"Período: {first_year}-{last_year}")
+        logger.info("")
         
-        # Baixar arquivos
-        all_files = []
         years = list(range(first_year, last_year + 1))
-        
-        print("=== Baixando arquivos ===")
-        for asset_code in asset_codes:
-            print(f"Ativo: {asset_code}")
-            for year in years:
-                file_path = self._download_file(asset_code, year)
-                if file_path:
-                    all_files.append(file_path)
-            print()
-        
-        if not all_files:
-            print("Nenhum arquivo foi baixado com sucesso.")
+
+        # Cache do resultado final: o atalho antes do pipeline só vale quando
+        # nenhum arquivo do ano atual precisa ser revalidado na rede — senão
+        # o pipeline roda (o GET condicional/TTL decide se rebaixa) e os
+        # caches por arquivo tornam a reexecução barata de qualquer forma
+        result_cache = self._result_cache_path(asset_codes, first_year, last_year,
+                                               self._existing_files(asset_codes, years))
+        if result_cache.exists() and not self._revalidation_needed(asset_codes, years):
+            try:
+                logger.info(f"Resultado encontrado em cache: {result_cache.name}")
+                return pd.read_parquet(result_cache)
+            except Exception as e:
+                # Cache corrompido: descartar e seguir para o pipeline
+                logger.warning(f"Cache de resultado inválido ({result_cache.name}), "
+                               f"reprocessando: {e}")
+                result_cache.unlink(missing_ok=True)
+
+        # Baixar e processar em pipeline: cada arquivo vai para o pool de
+        # processos assim que termina de baixar, sobrepondo rede e CPU
+        logger.info("=== Baixando e processando arquivos ===")
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = asyncio.run(self._download_and_parse_async(asset_codes, years, executor))
+        logger.info("")
+
+        if all(df is None for df in results):
+            logger.info("Nenhum arquivo foi baixado com sucesso.")
             return pd.DataFrame()
-        
-        print(f"=== Processando {len(all_files)} arquivos ===")
-        
-        # Processar arquivos
-        all_data = []
-        for file_path in all_files:
-            df = self._read_excel_file(file_path)
-            if not df.empty:
-                all_data.append(df)
-        
+
+        all_data = [df for df in results if df is not None and not df.empty]
+
         if not all_data:
-            print("Nenhum dado foi extraído dos arquivos.")
+            logger.info("Nenhum dado foi extraído dos arquivos.")
             return pd.DataFrame()
-        
+
         # Consolidar dados
         result = pd.concat(all_data, ignore_index=True)
-        
-        # Processar nomes dos ativos
-        result['asset_code'] = result['asset_code'].apply(self._denormalize_asset_code)
-        
-        # Adicionar data de vencimento
-        result['maturity_date'] = result['asset_code'].apply(self._get_maturity_date)
+
+        # Usar dtypes com backend PyArrow: strings deixam de ser arrays de
+        # objetos Python, reduzindo memória e acelerando ordenação.
+        # convert_integer=False: preços/taxas sem casas decimais não podem
+        # virar int64, senão o float32 dobra de tamanho e o schema do
+        # Parquet passa a depender dos dados
+        result = result.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+
+        # Converter asset_code para categórico: cada linha passa a guardar um
+        # código inteiro em vez de uma string, o que encolhe a coluna e faz a
+        # ordenação comparar inteiros. A desnormalização é calculada só sobre
+        # as categorias e aplicada via map — nomes de abas distintos que
+        # desnormalizam para o mesmo código são mesclados em vez de
+        # estourarem em rename_categories (que exige categorias únicas)
+        result['asset_code'] = result['asset_code'].astype('category')
+        denorm_map = {
+            code: self._denormalize_asset_code(code)
+            for code in result['asset_code'].cat.categories
+        }
+        result['asset_code'] = result['asset_code'].map(denorm_map).astype('category')
+
+        # Adicionar data de vencimento (também só sobre as categorias)
+        maturity_map = {
+            code: self._get_maturity_date(code)
+            for code in result['asset_code'].cat.categories
+        }
+        result['maturity_date'] = result['asset_code'].map(maturity_map)
         
         # Ordenar por data
         result = result.sort_values(['asset_code', 'ref_date']).reset_index(drop=True)
         
-        print(f"=== Dados consolidados ===")
-        print(f"Total de registros: {len(result)}")
-        print(f"Período: {result['ref_date'].min().date()} até {result['ref_date'].max().date()}")
-        print(f"Ativos únicos: {result['asset_code'].nunique()}")
+        # Salvar resultado para reexecuções futuras (recalcular a chave:
+        # downloads feitos durante o pipeline mudam os mtimes de origem).
+        # Falha ao gravar o cache não pode descartar o resultado já calculado
+        result_cache = self._result_cache_path(asset_codes, first_year, last_year,
+                                               self._existing_files(asset_codes, years))
+        try:
+            _write_parquet_atomic(result, result_cache, compression='snappy')
+        except Exception as e:
+            logger.warning(f"Falha ao salvar cache de resultado {result_cache.name}: {e}")
+
+        logger.info(f"=== Dados consolidados ===")
+        logger.info(f"Total de registros: {len(result)}")
+        logger.info(f"Período: {result['ref_date'].min().date()} até {result['ref_date'].max().date()}")
+        logger.info(f"Ativos únicos: {result['asset_code'].nunique()}")
         
         return result
 
@@ -389,6 +945,8 @@ def get_available_assets() -> List[str]:
 
 if __name__ == "__main__":
     # Exemplo de uso
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print("=== Exemplo de uso do TesouroDireto ===")
     
     # Baixar dados do LTN para 2020-2022